@@ -19,7 +19,7 @@ def run(rule, defined_variables, defined_actions):
     conditions, actions = rule['conditions'], rule['actions']
     rule_results = check_conditions_recursively(conditions, defined_variables)
     if isinstance(rule_results, pd.core.series.Series):
-        rule_triggered = True in rule_results.values
+        rule_triggered = bool(rule_results.values.any())
     else:
         rule_triggered = rule_results
     if rule_triggered:
@@ -1,10 +1,9 @@
 import inspect
 import re
-from functools import wraps
+from functools import lru_cache, wraps
 from typing import Union, Any, List, Tuple
-from uuid import uuid4
 import pandas
-from pandas.api.types import is_integer_dtype
+from pandas.api.types import is_integer_dtype, infer_dtype
 import sys
 
 from .six import string_types, integer_types
@@ -13,12 +12,43 @@ from .fields import (FIELD_DATAFRAME, FIELD_TEXT, FIELD_NUMERIC, FIELD_NO_INPUT,
                      FIELD_SELECT, FIELD_SELECT_MULTIPLE)
 from .utils import flatten_list, fn_name_to_pretty_label, float_to_decimal, vectorized_is_valid, vectorized_compare_dates, \
     vectorized_is_complete_date, vectorized_len, vectorized_get_dict_key, vectorized_is_in, vectorized_case_insensitive_is_in, \
-    vectorized_apply_regex, apply_regex
+    vectorized_apply_regex, apply_regex, get_date, get_date_component_value
 from decimal import Decimal, Inexact, Context
 import operator
 import numpy as np
 import pandas as pd
 
+try:
+    # google-re2 is an optional, DFA-based engine that is considerably
+    # faster than the stdlib's backtracking engine on typical rule patterns.
+    import re2 as _re2
+except ImportError:
+    _re2 = None
+
+try:
+    # polars is optional as well; its Arrow-backed string kernels are
+    # multi-threaded and much faster than pandas' object-dtype paths.
+    import polars as _polars
+except ImportError:
+    _polars = None
+
+
+@lru_cache(maxsize=1024)
+def _compile_regex(pattern):
+    """
+    Compile and cache regex patterns. Rules tend to reuse a small set of
+    patterns across many evaluations, so compiling once per pattern keeps
+    pattern parsing off the hot path. Patterns google-re2 cannot handle
+    (e.g. backreferences) fall back to the stdlib engine.
+    """
+    if _re2 is not None:
+        try:
+            return _re2.compile(pattern)
+        except _re2.error:
+            pass
+    return re.compile(pattern)
+
+
 class BaseType(object):
     def __init__(self, value):
         self.value = self._assert_valid_value_and_cast(value)
@@ -28,11 +58,20 @@ class BaseType(object):
 
     @classmethod
     def get_all_operators(cls):
-        methods = inspect.getmembers(cls)
-        return [{'name': m[0],
-                 'label': m[1].label,
-                 'input_type': m[1].input_type}
-                for m in methods if getattr(m[1], 'is_operator', False)]
+        # built once per class: a full inspect.getmembers scan walks the
+        # whole MRO and touches every attribute on each call, which adds
+        # up for apps that enumerate operators per request
+        if '_operator_registry' not in cls.__dict__:
+            operators = {}
+            for klass in reversed(cls.__mro__):
+                for name, member in vars(klass).items():
+                    if getattr(member, 'is_operator', False):
+                        operators[name] = member
+            cls._operator_registry = [{'name': name,
+                                       'label': operators[name].label,
+                                       'input_type': operators[name].input_type}
+                                      for name in sorted(operators)]
+        return cls._operator_registry
 
 def export_type(cls):
     """ Decorator to expose the given class to business_rules.export_rule_data. """
@@ -54,12 +93,30 @@ def type_operator(input_type, label=None,
             or fn_name_to_pretty_label(func.__name__)
         func.input_type = input_type
 
+        if not assert_type_for_arguments or input_type == FIELD_NO_INPUT:
+            # nothing to cast per call - return the marked function itself so
+            # operator invocations don't pay for a wrapper frame
+            return func
+
+        parameters = list(inspect.signature(func).parameters)
+        if len(parameters) == 2:
+            # almost every operator takes exactly one comparison value;
+            # bake that arity (and the real parameter name, so keyword
+            # calls keep working) in to skip the *args/**kwargs machinery
+            namespace = {"_func": func}
+            exec(
+                "def inner(self, {arg}):\n"
+                "    return _func(self, self._assert_valid_value_and_cast({arg}))\n"
+                .format(arg=parameters[1]),
+                namespace,
+            )
+            return wraps(func)(namespace["inner"])
+
         @wraps(func)
         def inner(self, *args, **kwargs):
-            if assert_type_for_arguments:
-                args = [self._assert_valid_value_and_cast(arg) for arg in args]
-                kwargs = dict((k, self._assert_valid_value_and_cast(v))
-                              for k, v in kwargs.items())
+            args = [self._assert_valid_value_and_cast(arg) for arg in args]
+            kwargs = dict((k, self._assert_valid_value_and_cast(v))
+                          for k, v in kwargs.items())
             return func(self, *args, **kwargs)
         return inner
     return wrapper
@@ -87,7 +144,10 @@ class StringType(BaseType):
 
     @type_operator(FIELD_TEXT, label="Equal To (case insensitive)")
     def equal_to_case_insensitive(self, other_string):
-        return self.value.lower() == other_string.lower()
+        # casefold handles unicode better than lower; no length shortcut,
+        # since folding can change a string's length (e.g. "İ" folds to
+        # two code points)
+        return self.value.casefold() == other_string.casefold()
 
     @type_operator(FIELD_TEXT)
     def starts_with(self, other_string):
@@ -103,7 +163,7 @@ class StringType(BaseType):
 
     @type_operator(FIELD_TEXT)
     def matches_regex(self, regex):
-        return re.search(regex, self.value)
+        return _compile_regex(regex).search(self.value) is not None
 
     @type_operator(FIELD_NO_INPUT)
     def non_empty(self):
@@ -113,33 +173,54 @@ class StringType(BaseType):
 @export_type
 class NumericType(BaseType):
     EPSILON = Decimal('0.000001')
+    FLOAT_EPSILON = 1e-6
 
     name = "numeric"
 
     @staticmethod
     def _assert_valid_value_and_cast(value):
-        if isinstance(value, float):
-            # In python 2.6, casting float to Decimal doesn't work
-            return float_to_decimal(value)
-        if isinstance(value, integer_types):
-            return Decimal(value)
-        if isinstance(value, Decimal):
+        if isinstance(value, (float, Decimal)) or isinstance(value, integer_types):
+            # ints and floats are kept native - float arithmetic is much
+            # cheaper than Decimal and precise enough for the epsilon
+            # comparisons below. Decimal is only used when the caller
+            # passed one explicitly.
             return value
         else:
             raise AssertionError("{0} is not a valid numeric type.".
                                  format(value))
 
+    @staticmethod
+    def _coerce_to_decimal(value):
+        if isinstance(value, Decimal):
+            return value
+        if isinstance(value, float):
+            return float_to_decimal(value)
+        return Decimal(value)
+
+    def _difference_and_epsilon(self, other_numeric):
+        """
+        Returns (self.value - other_numeric, epsilon), upgrading both sides
+        to Decimal only when either one is already a Decimal.
+        """
+        if isinstance(self.value, Decimal) or isinstance(other_numeric, Decimal):
+            return (self._coerce_to_decimal(self.value)
+                    - self._coerce_to_decimal(other_numeric), self.EPSILON)
+        return self.value - other_numeric, self.FLOAT_EPSILON
+
     @type_operator(FIELD_NUMERIC)
     def equal_to(self, other_numeric):
-        return abs(self.value - other_numeric) <= self.EPSILON
+        difference, epsilon = self._difference_and_epsilon(other_numeric)
+        return abs(difference) <= epsilon
 
     @type_operator(FIELD_NUMERIC)
     def not_equal_to(self, other_numeric):
-        return abs(self.value - other_numeric) > self.EPSILON
+        difference, epsilon = self._difference_and_epsilon(other_numeric)
+        return abs(difference) > epsilon
 
     @type_operator(FIELD_NUMERIC)
     def greater_than(self, other_numeric):
-        return (self.value - other_numeric) > self.EPSILON
+        difference, epsilon = self._difference_and_epsilon(other_numeric)
+        return difference > epsilon
 
     @type_operator(FIELD_NUMERIC)
     def greater_than_or_equal_to(self, other_numeric):
@@ -147,7 +228,8 @@ class NumericType(BaseType):
 
     @type_operator(FIELD_NUMERIC)
     def less_than(self, other_numeric):
-        return (other_numeric - self.value) > self.EPSILON
+        difference, epsilon = self._difference_and_epsilon(other_numeric)
+        return -difference > epsilon
 
     @type_operator(FIELD_NUMERIC)
     def less_than_or_equal_to(self, other_numeric):
@@ -192,19 +274,44 @@ class SelectType(BaseType):
         else:
             return value_from_list == other_value
 
-    @type_operator(FIELD_SELECT, assert_type_for_arguments=False)
-    def contains(self, other_value):
+    @property
+    def _value_set(self):
+        """
+        Case-insensitive hash set over the select's values, built once per
+        instance so membership checks are O(1) probes instead of linear
+        scans. Falls back to None when a value is unhashable.
+        """
+        if not hasattr(self, '_cached_value_set'):
+            try:
+                self._cached_value_set = {
+                    value.lower() if isinstance(value, string_types) else value
+                    for value in self.value
+                }
+            except TypeError:
+                self._cached_value_set = None
+        return self._cached_value_set
+
+    def _select_contains(self, other_value):
+        value_set = self._value_set
+        if value_set is not None:
+            if isinstance(other_value, string_types):
+                return other_value.lower() in value_set
+            try:
+                return other_value in value_set
+            except TypeError:
+                return False
         for val in self.value:
             if self._case_insensitive_equal_to(val, other_value):
                 return True
         return False
 
+    @type_operator(FIELD_SELECT, assert_type_for_arguments=False)
+    def contains(self, other_value):
+        return self._select_contains(other_value)
+
     @type_operator(FIELD_SELECT, assert_type_for_arguments=False)
     def does_not_contain(self, other_value):
-        for val in self.value:
-            if self._case_insensitive_equal_to(val, other_value):
-                return False
-        return True
+        return not self._select_contains(other_value)
 
 
 @export_type
@@ -218,18 +325,35 @@ class SelectMultipleType(BaseType):
                                  format(value))
         return value
 
+    @staticmethod
+    def _case_insensitive_set(values):
+        """
+        Builds a set with strings lowercased, matching the case-insensitive
+        equality used by SelectType.contains. Hash probes replace the
+        linear scans the operators below previously did per element.
+        """
+        return {value.lower() if isinstance(value, string_types) else value
+                for value in values}
+
+    @property
+    def _value_set(self):
+        if not hasattr(self, '_cached_value_set'):
+            self._cached_value_set = self._case_insensitive_set(self.value)
+        return self._cached_value_set
+
     @type_operator(FIELD_SELECT_MULTIPLE)
     def contains_all(self, other_value):
-        select = SelectType(self.value)
-        for other_val in other_value:
-            if not select.contains(other_val):
-                return False
-        return True
+        # Probe element by element instead of materializing the comparator
+        # set, so the first missing element short-circuits the whole check.
+        value_set = self._value_set
+        return all(
+            (value.lower() if isinstance(value, string_types) else value) in value_set
+            for value in other_value
+        )
 
     @type_operator(FIELD_SELECT_MULTIPLE)
     def is_contained_by(self, other_value):
-        other_select_multiple = SelectMultipleType(other_value)
-        return other_select_multiple.contains_all(self.value)
+        return self._value_set.issubset(self._case_insensitive_set(other_value))
 
     @type_operator(FIELD_SELECT_MULTIPLE)
     def is_not_contained_by(self, other_value):
@@ -237,26 +361,19 @@ class SelectMultipleType(BaseType):
 
     @type_operator(FIELD_SELECT_MULTIPLE)
     def shares_at_least_one_element_with(self, other_value):
-        select = SelectType(self.value)
-        for other_val in other_value:
-            if select.contains(other_val):
-                return True
-        return False
+        value_set = self._value_set
+        return any(
+            (value.lower() if isinstance(value, string_types) else value) in value_set
+            for value in other_value
+        )
 
     @type_operator(FIELD_SELECT_MULTIPLE)
     def shares_exactly_one_element_with(self, other_value):
-        found_one = False
-        select = SelectType(self.value)
-        for other_val in other_value:
-            if select.contains(other_val):
-                if found_one:
-                    return False
-                found_one = True
-        return found_one
+        return len(self._value_set & self._case_insensitive_set(other_value)) == 1
 
     @type_operator(FIELD_SELECT_MULTIPLE)
     def shares_no_elements_with(self, other_value):
-        return not self.shares_at_least_one_element_with(other_value)
+        return self._value_set.isdisjoint(self._case_insensitive_set(other_value))
 
 @export_type
 class DataframeType(BaseType):
@@ -270,6 +387,52 @@ class DataframeType(BaseType):
         self.value_level_metadata = data.get("value_level_metadata", [])
         self.column_codelist_map = data.get("column_codelist_map", {})
         self.codelist_term_maps = data.get("codelist_term_maps", [])
+        self._numeric_cache = {}
+        self._column_array_cache = {}
+        self._lower_cache = {}
+        self._parsed_date_cache = {}
+        self._additional_column_cache = {}
+        self._ordered_cache = {}
+        self._unique_cache = {}
+        self._length_cache = {}
+        self._valid_date_cache = {}
+        self._complete_date_cache = {}
+        self._date_component_cache = {}
+        self._categorize_low_cardinality_strings()
+
+    def _categorize_low_cardinality_strings(self):
+        """
+        Converts repetitive string columns to the category dtype so that
+        the isin/groupby/duplicated/unique calls the operators lean on run
+        against integer codes instead of python strings. Columns where
+        most values are distinct gain nothing and are left alone, as are
+        columns holding anything other than plain strings. The conversion
+        happens on a shallow copy so the caller's dataframe keeps its
+        dtypes.
+        """
+        if not isinstance(self.value, pd.DataFrame):
+            return
+        converted = {}
+        for column in self.value.columns:
+            series = self.value[column]
+            if series.dtype != object or len(series) == 0:
+                continue
+            try:
+                unique_values = series.unique()
+            except TypeError:
+                # unhashable values, e.g. list-valued columns
+                continue
+            if len(unique_values) / len(series) >= 0.5:
+                continue
+            # columns holding None are skipped because the conversion would
+            # coerce None to NaN, which the null-sensitive operators treat
+            # differently
+            if all(isinstance(value, str) for value in unique_values):
+                converted[column] = series.astype("category")
+        if converted:
+            self.value = self.value.copy(deep=False)
+            for column, series in converted.items():
+                self.value[column] = series
 
     def _assert_valid_value_and_cast(self, value):
         if not hasattr(value, '__iter__'):
@@ -279,16 +442,62 @@ class DataframeType(BaseType):
 
     def convert_string_data_to_lower(self, data):
         if isinstance(data, pd.core.series.Series):
-            data = data.str.lower()
+            data = self._lower_series(data)
         else:
             data = data.lower()
         return data
 
+    def _lower_comparison_data(self, data):
+        """
+        Lowercase comparator data, reusing the per-column cache when the
+        data is one of our columns.
+        """
+        if isinstance(data, pd.core.series.Series):
+            return self._lower_column(data.name)
+        return data.lower()
+
+    def _lower_column(self, column_name: str) -> pd.Series:
+        """
+        Lowercased view of a column, memoized by name - rule sets often
+        apply several case-insensitive operators to the same column and
+        the lowercase pass is a full column rewrite each time.
+        """
+        if column_name not in self._lower_cache:
+            self._lower_cache[column_name] = self._lower_series(self.value[column_name])
+        return self._lower_cache[column_name]
+
+    def _lower_series(self, series: pd.Series) -> pd.Series:
+        """
+        Lowercase a string column, dispatching to polars' multi-threaded
+        string kernel when it is installed and can represent the column.
+        Falls back to pandas for mixed-type columns.
+        """
+        if _polars is not None:
+            try:
+                lowered = _polars.Series(series.to_numpy()).str.to_lowercase()
+                return pd.Series(lowered.to_list(), index=series.index, name=series.name)
+            except (TypeError, _polars.exceptions.PolarsError):
+                pass
+        return series.str.lower()
+
+    @property
+    def _prefix_regex(self):
+        """
+        Single compiled alternation over all mapped prefixes, so
+        replace_prefix does one scan per value instead of one startswith
+        per map entry. Alternatives are tried in map order, matching the
+        first-hit semantics of the previous loop.
+        """
+        if not hasattr(self, '_cached_prefix_regex'):
+            self._cached_prefix_regex = re.compile(
+                "|".join(re.escape(prefix) for prefix in self.column_prefix_map))
+        return self._cached_prefix_regex
+
     def replace_prefix(self, value: str) -> Union[str, Any]:
-        if isinstance(value, str):
-            for prefix, replacement in self.column_prefix_map.items():
-                if value.startswith(prefix):
-                    return value.replace(prefix, replacement, 1)
+        if isinstance(value, str) and self.column_prefix_map:
+            match = self._prefix_regex.match(value)
+            if match:
+                return self.column_prefix_map[match.group(0)] + value[match.end():]
         return value
 
     def replace_all_prefixes(self, values: [str]) -> [str]:
@@ -302,19 +511,75 @@ class DataframeType(BaseType):
         else:
             return self.value.get(comparator, comparator)
 
+    def _column_array(self, column_name: str) -> np.ndarray:
+        """
+        Raw numpy view of a column, memoized by name. Rule evaluation hits
+        the same columns over and over; going through the cache skips the
+        pandas indexing machinery on every access.
+        """
+        if column_name not in self._column_array_cache:
+            self._column_array_cache[column_name] = self.value[column_name].to_numpy()
+        return self._column_array_cache[column_name]
+
+    def _as_numeric(self, data: Union[pd.Series, Any]) -> Union[np.ndarray, Any]:
+        """
+        Numeric view of a column, memoized by column name - many rules
+        compare against the same column, so the to_numeric parse is done
+        once per column instead of once per operator call. Scalars are
+        passed through unchanged.
+        """
+        if not isinstance(data, pd.Series):
+            return data
+        if data.name not in self._numeric_cache:
+            self._numeric_cache[data.name] = pd.to_numeric(data, errors="coerce").to_numpy()
+        return self._numeric_cache[data.name]
+
     def is_column_of_iterables(self, column):
         return isinstance(column, pandas.core.series.Series) and (isinstance(column.iloc[0], list) or  isinstance(column.iloc[0], set))
 
+    def _isin_exploded(self, iterable_column: pd.Series, comparison_data, case_insensitive: bool = False) -> np.ndarray:
+        """
+        Row-wise membership of comparison_data in a column whose cells are
+        lists or sets. Exploding the column once lets the comparison and the
+        per-row any() run in pandas C code instead of a python call per row.
+        """
+        flat: pd.Series = iterable_column.explode()
+        if case_insensitive:
+            flat = flat.str.lower()
+        if isinstance(comparison_data, pd.Series):
+            comparison_values = comparison_data.reindex(flat.index).to_numpy()
+        else:
+            comparison_values = comparison_data
+        hits = pd.Series(flat.to_numpy() == comparison_values, index=flat.index)
+        return hits.groupby(level=0).any().reindex(iterable_column.index, fill_value=False).to_numpy()
+
     @type_operator(FIELD_DATAFRAME)
     def exists(self, other_value) -> pd.Series:
         target_column = self.replace_prefix(other_value.get("target"))
-        return pd.Series([target_column in self.value] * len(self.value))
+        # np.full allocates one contiguous bool buffer instead of building
+        # an N-element python list first
+        return pd.Series(np.full(len(self.value), target_column in self.value, dtype=bool))
 
     @type_operator(FIELD_DATAFRAME)
     def not_exists(self, other_value):
         return ~self.exists(other_value)
     
-    def _check_equality(self, row, target, comparator, value_is_literal: bool = False, case_insensitive: bool = False) -> bool:
+    def _is_null_data(self, data) -> Union[bool, np.ndarray]:
+        """
+        Nullity mask for a column or a scalar comparator.
+        Empty strings are treated the same as missing values.
+        """
+        if isinstance(data, pd.Series):
+            null_mask = data.isna()
+            if data.dtype == object or isinstance(data.dtype, pd.CategoricalDtype):
+                # only string-holding columns can contain empty strings;
+                # skipping the comparison for numeric columns saves a full
+                # column pass
+                null_mask |= data == ""
+            return null_mask.values
+        return data is None or data == ""
+
+    def _check_equality(self, target, comparator, value_is_literal: bool = False, case_insensitive: bool = False) -> pd.Series:
         """
         Equality checks work slightly differently for clinical datasets. See truth table below:
         Operator       --A         --B         Outcome
@@ -322,18 +587,14 @@ class DataframeType(BaseType):
         equal_to       "" or null  Populated   False
         equal_to       Populated   "" or null  False
         equal_to       Populated   Populated   A == B
+
+        The whole column is compared at once with numpy instead of
+        applying a python-level check row by row.
         """
-        comparison_data = comparator if comparator not in row or value_is_literal else row[comparator]
-        both_null = (comparison_data == "" or comparison_data is None) & (row[target] == "" or row[target] is None)
-        if both_null:
-            return False
-        if case_insensitive:
-            target_val = row[target].lower() if row[target] else None
-            comparison_val = comparison_data.lower() if comparison_data else None
-            return target_val == comparison_val
-        return row[target] == comparison_data
+        comparison_data = self.get_comparator_data(comparator, value_is_literal)
+        return self._null_aware_comparison(target, comparison_data, operator.eq, case_insensitive)
 
-    def _check_inequality(self, row, target, comparator, value_is_literal: bool = False, case_insensitive: bool = False) -> bool:
+    def _check_inequality(self, target, comparator, value_is_literal: bool = False, case_insensitive: bool = False) -> pd.Series:
         """
         Equality checks work slightly differently for clinical datasets. See truth table below:
         Operator       --A         --B         Outcome
@@ -342,43 +603,68 @@ class DataframeType(BaseType):
         not_equal_to   Populated   "" or null  True
         not_equal_to   Populated   Populated   A != B
         """
-        comparison_data = comparator if comparator not in row or value_is_literal else row[comparator]
-        both_null = (comparison_data == "" or comparison_data is None) & (row[target] == "" or row[target] is None)
-        if both_null:
-            return False
+        comparison_data = self.get_comparator_data(comparator, value_is_literal)
+        return self._null_aware_comparison(target, comparison_data, operator.ne, case_insensitive)
+
+    def _null_aware_comparison(self, target: str, comparison_data, compare, case_insensitive: bool = False) -> pd.Series:
+        """
+        Shared core of the equality operators: compares the target column
+        against comparison_data (a scalar, a column or a derived Series)
+        with the both-null rows forced to False.
+        """
+        comparison_null = self._is_null_data(comparison_data)
+        if comparison_null is False:
+            # populated scalar comparator: no row can be null on both
+            # sides, so skip building the target null mask entirely
+            both_null = False
+        else:
+            both_null = self._is_null_data(self.value[target]) & comparison_null
+        is_column = isinstance(comparison_data, pd.Series) \
+            and comparison_data.name in self.value.columns
         if case_insensitive:
-            target_val = row[target].lower() if row[target] else None
-            comparison_val = comparison_data.lower() if comparison_data else None
-            return target_val != comparison_val
-        return row[target] != comparison_data
+            target_values = self._lower_column(target).values
+            if isinstance(comparison_data, pd.Series):
+                comparison_data = self._lower_comparison_data(comparison_data).values \
+                    if is_column else self._lower_series(comparison_data).values
+            elif comparison_data is not None:
+                comparison_data = comparison_data.lower()
+        else:
+            target_values = self._column_array(target)
+            if isinstance(comparison_data, pd.Series):
+                comparison_data = self._column_array(comparison_data.name) \
+                    if is_column else comparison_data.to_numpy()
+        results = compare(target_values, comparison_data)
+        if both_null is not False:
+            results = results & ~both_null
+        return pd.Series(results)
 
     @type_operator(FIELD_DATAFRAME)
     def equal_to(self, other_value) -> pd.Series:
         target = self.replace_prefix(other_value.get("target"))
         value_is_literal = other_value.get("value_is_literal", False)
         comparator = self.replace_prefix(other_value.get("comparator")) if not value_is_literal else other_value.get("comparator")
-        return self.value.apply(lambda row: self._check_equality(row, target, comparator, value_is_literal), axis=1)
+        return self._check_equality(target, comparator, value_is_literal)
 
     @type_operator(FIELD_DATAFRAME)
     def equal_to_case_insensitive(self, other_value):
         target = self.replace_prefix(other_value.get("target"))
         value_is_literal = other_value.get("value_is_literal", False)
         comparator = self.replace_prefix(other_value.get("comparator")) if not value_is_literal else other_value.get("comparator")
-        return self.value.apply(lambda row: self._check_equality(row, target, comparator, value_is_literal, case_insensitive=True), axis=1)
+        return self._check_equality(target, comparator, value_is_literal, case_insensitive=True)
 
     @type_operator(FIELD_DATAFRAME)
     def not_equal_to_case_insensitive(self, other_value):
         target = self.replace_prefix(other_value.get("target"))
         value_is_literal = other_value.get("value_is_literal", False)
         comparator = self.replace_prefix(other_value.get("comparator")) if not value_is_literal else other_value.get("comparator")
-        return self.value.apply(lambda row: self._check_inequality(row, target, comparator, value_is_literal, case_insensitive=True), axis=1)
+        return self._check_inequality(target, comparator, value_is_literal, case_insensitive=True)
 
     @type_operator(FIELD_DATAFRAME)
     def not_equal_to(self, other_value):
         target = self.replace_prefix(other_value.get("target"))
         value_is_literal = other_value.get("value_is_literal", False)
         comparator = self.replace_prefix(other_value.get("comparator")) if not value_is_literal else other_value.get("comparator")
-        return self.value.apply(lambda row: self._check_inequality(row, target, comparator, value_is_literal), axis=1)
+        return self._check_inequality(target, comparator, value_is_literal)
 
     @type_operator(FIELD_DATAFRAME)
     def suffix_equal_to(self, other_value: dict) -> pd.Series:
@@ -453,7 +739,14 @@ class DataframeType(BaseType):
         return ~self.suffix_is_contained_by(other_value)
     
     def _get_string_part_series(self, part_to_validate: str, length: int, target: str):
-        if not self.value[target].apply(type).eq(str).all():
+        target_series = self.value[target]
+        if isinstance(target_series.dtype, pd.CategoricalDtype):
+            values_to_check = target_series.cat.categories
+        else:
+            values_to_check = target_series
+        # "empty" keeps zero-row columns vacuously valid, as the old
+        # apply(type).eq(str).all() check was
+        if infer_dtype(values_to_check, skipna=False) not in ("string", "empty"):
             raise ValueError("The operator can't be used with non-string values")
 
         if part_to_validate == "suffix":
@@ -467,7 +760,7 @@ class DataframeType(BaseType):
 
     def _value_is_contained_by(self, series: pd.Series, comparison_data) -> pd.Series:
         if self.is_column_of_iterables(comparison_data):
-            results = vectorized_is_in(series, comparison_data)
+            results = self._isin_exploded(comparison_data, series)
         else:
             results = series.isin(comparison_data)
         return pd.Series(results)
@@ -490,48 +783,36 @@ class DataframeType(BaseType):
         target = self.replace_prefix(other_value.get("target"))
         value_is_literal = other_value.get("value_is_literal", False)
         comparator = self.replace_prefix(other_value.get("comparator")) if not value_is_literal else other_value.get("comparator")
-        comparison_data = self.get_comparator_data(comparator, value_is_literal)
-        target_column = pd.to_numeric(self.value[target], errors="coerce")
-        if isinstance(comparison_data, pd.Series):
-            comparison_data = pd.to_numeric(comparison_data, errors="coerce")
-        results = np.where(target_column < comparison_data, True, False)
-        return pd.Series(results)
+        comparison_data = self._as_numeric(self.get_comparator_data(comparator, value_is_literal))
+        target_column = self._as_numeric(self.value[target])
+        return pd.Series(target_column < comparison_data)
     
     @type_operator(FIELD_DATAFRAME)
     def less_than_or_equal_to(self, other_value):
         target = self.replace_prefix(other_value.get("target"))
         value_is_literal = other_value.get("value_is_literal", False)
         comparator = self.replace_prefix(other_value.get("comparator")) if not value_is_literal else other_value.get("comparator")
-        comparison_data = self.get_comparator_data(comparator, value_is_literal)
-        target_column = pd.to_numeric(self.value[target], errors="coerce")
-        if isinstance(comparison_data, pd.Series):
-            comparison_data = pd.to_numeric(comparison_data, errors="coerce")
-        results = np.where(target_column <= comparison_data, True, False)
-        return pd.Series(results)
+        comparison_data = self._as_numeric(self.get_comparator_data(comparator, value_is_literal))
+        target_column = self._as_numeric(self.value[target])
+        return pd.Series(target_column <= comparison_data)
     
     @type_operator(FIELD_DATAFRAME)
     def greater_than_or_equal_to(self, other_value):
         target = self.replace_prefix(other_value.get("target"))
         value_is_literal = other_value.get("value_is_literal", False)
         comparator = self.replace_prefix(other_value.get("comparator")) if not value_is_literal else other_value.get("comparator")
-        comparison_data = self.get_comparator_data(comparator, value_is_literal)
-        target_column = pd.to_numeric(self.value[target], errors="coerce")
-        if isinstance(comparison_data, pd.Series):
-            comparison_data = pd.to_numeric(comparison_data, errors="coerce")
-        results = np.where(target_column >= comparison_data, True, False)
-        return pd.Series(results)
+        comparison_data = self._as_numeric(self.get_comparator_data(comparator, value_is_literal))
+        target_column = self._as_numeric(self.value[target])
+        return pd.Series(target_column >= comparison_data)
     
     @type_operator(FIELD_DATAFRAME)
     def greater_than(self, other_value):
         target = self.replace_prefix(other_value.get("target"))
         value_is_literal = other_value.get("value_is_literal", False)
         comparator = self.replace_prefix(other_value.get("comparator")) if not value_is_literal else other_value.get("comparator")
-        comparison_data = self.get_comparator_data(comparator, value_is_literal)
-        target_column = pd.to_numeric(self.value[target], errors="coerce")
-        if isinstance(comparison_data, pd.Series):
-            comparison_data = pd.to_numeric(comparison_data, errors="coerce")
-        results = np.where(target_column > comparison_data, True, False)
-        return pd.Series(results)
+        comparison_data = self._as_numeric(self.get_comparator_data(comparator, value_is_literal))
+        target_column = self._as_numeric(self.value[target])
+        return pd.Series(target_column > comparison_data)
 
     @type_operator(FIELD_DATAFRAME)
     def contains(self, other_value):
@@ -539,13 +820,17 @@ class DataframeType(BaseType):
         value_is_literal = other_value.get("value_is_literal", False)
         comparator = self.replace_prefix(other_value.get("comparator")) if not value_is_literal else other_value.get("comparator")
         comparison_data = self.get_comparator_data(comparator, value_is_literal)
-        if self.is_column_of_iterables(self.value[target]) or isinstance(comparison_data, str):
-            results = vectorized_is_in(comparison_data, self.value[target])
+        if self.is_column_of_iterables(self.value[target]):
+            results = self._isin_exploded(self.value[target], comparison_data)
+        elif isinstance(comparison_data, str):
+            # substring search stays inside pandas instead of a per-cell
+            # python membership test
+            results = self.value[target].str.contains(comparison_data, regex=False, na=False)
         elif isinstance(comparator, pandas.core.series.Series):
-            results = np.where(comparison_data.isin(self.value[target]), True, False)
+            results = comparison_data.isin(self.value[target])
         else:
             # Handles numeric case. This case should never occur
-            results = np.where(self.value[target] == comparison_data, True, False)
+            results = self.value[target] == comparison_data
         return pd.Series(results)
     
     @type_operator(FIELD_DATAFRAME)
@@ -558,13 +843,13 @@ class DataframeType(BaseType):
         value_is_literal = other_value.get("value_is_literal", False)
         comparator = self.replace_prefix(other_value.get("comparator")) if not value_is_literal else other_value.get("comparator")
         comparison_data = self.get_comparator_data(comparator, value_is_literal)
-        comparison_data = self.convert_string_data_to_lower(comparison_data)
+        comparison_data = self._lower_comparison_data(comparison_data)
         if self.is_column_of_iterables(self.value[target]):
-            results = vectorized_case_insensitive_is_in(comparison_data, self.value[target])
+            results = self._isin_exploded(self.value[target], comparison_data, case_insensitive=True)
         elif isinstance(comparator, pandas.core.series.Series) or isinstance(comparison_data, pandas.core.series.Series):
-            results = np.where(comparison_data.isin(self.value[target].str.lower()), True, False)
+            results = comparison_data.isin(self._lower_column(target))
         else:
-            results = vectorized_is_in(comparison_data.lower(), self.value[target].str.lower())
+            results = self._lower_column(target).str.contains(comparison_data, regex=False, na=False)
         return pd.Series(results)
 
     @type_operator(FIELD_DATAFRAME)
@@ -581,7 +866,7 @@ class DataframeType(BaseType):
             comparator = self.replace_prefix(comparator)
         comparison_data = self.get_comparator_data(comparator, value_is_literal)
         if self.is_column_of_iterables(comparison_data):
-            results = vectorized_is_in(self.value[target], comparison_data)
+            results = self._isin_exploded(comparison_data, self.value[target])
         else:
             results = self.value[target].isin(comparison_data)
         return pd.Series(results)
@@ -602,37 +887,67 @@ class DataframeType(BaseType):
             comparator = self.replace_prefix(comparator)
         comparison_data = self.get_comparator_data(comparator, value_is_literal)
         if self.is_column_of_iterables(comparison_data):
-            results = vectorized_case_insensitive_is_in(self.value[target].str.lower(), comparison_data)
+            results = self._isin_exploded(comparison_data, self._lower_column(target), case_insensitive=True)
             return pd.Series(results)
         elif isinstance(comparison_data, pd.core.series.Series):
-            results = self.value[target].str.lower().isin(comparison_data.str.lower())
+            results = self._lower_column(target).isin(self._lower_column(comparison_data.name))
         else:
-            results = self.value[target].str.lower().isin(comparison_data)
-        return pd.Series(results.values)
+            results = self._lower_column(target).isin(comparison_data)
+        return results
 
     @type_operator(FIELD_DATAFRAME)
     def is_not_contained_by_case_insensitive(self, other_value):
         return ~self.is_contained_by_case_insensitive(other_value)
     
+    def _regex_contains(self, series: pd.Series, pattern: str) -> pd.Series:
+        """
+        Boolean mask of rows whose value matches the pattern anywhere,
+        using pandas' C regex loop when the compiled pattern is a stdlib
+        one (re2 pattern objects are searched via map instead).
+        """
+        compiled = _compile_regex(pattern)
+        if isinstance(compiled, re.Pattern):
+            return series.str.contains(compiled, na=False)
+        return series.map(lambda x: compiled.search(x) is not None)
+
+    def _elementwise_str_check(self, check, target: str, comparison_data: pd.Series) -> pd.Series:
+        """
+        Pairs each target value with the comparison value on the same row
+        and applies a string predicate such as str.startswith, filling one
+        preallocated boolean array instead of going through pandas' .str
+        object loop. Rows where either side is missing (or not a string)
+        come out False, matching pandas' na handling.
+        """
+        pairs = zip(self.value[target].to_numpy(), comparison_data.to_numpy())
+        results = np.fromiter(
+            (
+                isinstance(value, str) and isinstance(other, str) and check(value, other)
+                for value, other in pairs
+            ),
+            dtype=bool,
+            count=len(self.value),
+        )
+        return pd.Series(results, index=self.value.index)
+
     @type_operator(FIELD_DATAFRAME)
     def prefix_matches_regex(self, other_value):
         target = self.replace_prefix(other_value.get("target"))
         comparator = other_value.get("comparator")
         prefix = other_value.get("prefix")
-        results = self.value[target].map(lambda x: re.search(comparator, x[:prefix]) is not None)
-        return pd.Series(results.values)
-    
+        results = self._regex_contains(self.value[target].str.slice(stop=prefix), comparator)
+        return results
+
     @type_operator(FIELD_DATAFRAME)
     def not_prefix_matches_regex(self, other_value):
         return ~self.prefix_matches_regex(other_value)
-  
+
     @type_operator(FIELD_DATAFRAME)
     def suffix_matches_regex(self, other_value):
         target = self.replace_prefix(other_value.get("target"))
         comparator = other_value.get("comparator")
         suffix = other_value.get("suffix")
-        results = self.value[target].apply(lambda x: re.search(comparator, x[-suffix:]) is not None)
-        return pd.Series(results.values)
+        results = self._regex_contains(self.value[target].str.slice(-suffix), comparator)
+        return results
     
     @type_operator(FIELD_DATAFRAME)
     def not_suffix_matches_regex(self, other_value):
@@ -642,8 +957,11 @@ class DataframeType(BaseType):
     def matches_regex(self, other_value):
         target = self.replace_prefix(other_value.get("target"))
         comparator = other_value.get("comparator")
-        results = self.value[target].str.match(comparator)
-        return pd.Series(results.values)
+        compiled = _compile_regex(comparator)
+        if isinstance(compiled, re.Pattern):
+            return self.value[target].str.match(compiled, na=False)
+        results = self.value[target].map(lambda x: compiled.match(x) is not None)
+        return results
     
     @type_operator(FIELD_DATAFRAME)
     def not_matches_regex(self, other_value):
@@ -665,10 +983,9 @@ class DataframeType(BaseType):
             parsed_data = apply_regex(regex, comparison_data)
         else:
             parsed_data = pd.Series(vectorized_apply_regex(regex, comparison_data))
-        print(parsed_data)
-        parsed_id = str(uuid4())
-        self.value[parsed_id] = parsed_data
-        return self.value.apply(lambda row: self._check_equality(row, target, parsed_id, value_is_literal), axis=1)
+        # compare the parsed values directly instead of staging them in a
+        # temporary column on self.value
+        return self._null_aware_comparison(target, parsed_data, operator.eq)
 
     @type_operator(FIELD_DATAFRAME)
     def does_not_equal_string_part(self, other_value):
@@ -682,10 +999,11 @@ class DataframeType(BaseType):
         value_is_literal: bool = other_value.get("value_is_literal", False)
         comparison_data: Union[str, pd.Series] = self.get_comparator_data(comparator, value_is_literal)
         if isinstance(comparison_data, pd.Series):
-            # need to convert series to tuple to make startswith operator work correctly
-            comparison_data: Tuple[str] = tuple(comparison_data)
+            # compare each row against its own prefix instead of the tuple
+            # fallback, which checked every row against every prefix
+            return self._elementwise_str_check(str.startswith, target, comparison_data)
         results = self.value[target].str.startswith(comparison_data)
-        return pd.Series(results.values)
+        return results
 
     @type_operator(FIELD_DATAFRAME)
     def ends_with(self, other_value):
@@ -694,10 +1012,20 @@ class DataframeType(BaseType):
         value_is_literal: bool = other_value.get("value_is_literal", False)
         comparison_data: Union[str, pd.Series] = self.get_comparator_data(comparator, value_is_literal)
         if isinstance(comparison_data, pd.Series):
-            # need to convert series to tuple to make endswith operator work correctly
-            comparison_data: Tuple[str] = tuple(comparison_data)
+            # compare each row against its own suffix instead of the tuple
+            # fallback, which checked every row against every suffix
+            return self._elementwise_str_check(str.endswith, target, comparison_data)
         results = self.value[target].str.endswith(comparison_data)
-        return pd.Series(results.values)
+        return results
+
+    def _string_lengths(self, column_name: str) -> pd.Series:
+        """
+        Memoizes `.str.len()` per column so that the length comparators
+        don't recompute it when several length checks hit the same column.
+        """
+        if column_name not in self._length_cache:
+            self._length_cache[column_name] = self.value[column_name].str.len()
+        return self._length_cache[column_name]
 
     @type_operator(FIELD_DATAFRAME)
     def has_equal_length(self, other_value: dict):
@@ -712,11 +1040,14 @@ class DataframeType(BaseType):
         comparison_data: Union[int, pd.Series] = self.get_comparator_data(comparator, value_is_literal)
         if isinstance(comparison_data, pd.Series):
             if is_integer_dtype(comparison_data):
-                results = self.value[target].str.len().eq(comparison_data)
+                results = self._string_lengths(target).eq(comparison_data)
             else:
-                results = self.value[target].str.len().eq(comparison_data.str.len())
+                comparison_lengths = (
+                    comparison_data.str.len() if value_is_literal else self._string_lengths(comparator)
+                )
+                results = self._string_lengths(target).eq(comparison_lengths)
         else:
-            results = self.value[target].str.len().eq(comparator)
+            results = self._string_lengths(target).eq(comparator)
         return pd.Series(results)
 
     @type_operator(FIELD_DATAFRAME)
@@ -736,12 +1067,15 @@ class DataframeType(BaseType):
         comparison_data: Union[int, pd.Series] = self.get_comparator_data(comparator, value_is_literal)
         if isinstance(comparison_data, pd.Series):
             if is_integer_dtype(comparison_data):
-                results = self.value[target].str.len().gt(comparison_data)
+                results = self._string_lengths(target).gt(comparison_data)
             else:
-                results = self.value[target].str.len().gt(comparison_data.str.len())
+                comparison_lengths = (
+                    comparison_data.str.len() if value_is_literal else self._string_lengths(comparator)
+                )
+                results = self._string_lengths(target).gt(comparison_lengths)
         else:
-            results = self.value[target].str.len().gt(comparison_data)
-        return pd.Series(results.values)
+            results = self._string_lengths(target).gt(comparison_data)
+        return results
 
     @type_operator(FIELD_DATAFRAME)
     def longer_than_or_equal_to(self, other_value: dict):
@@ -751,12 +1085,15 @@ class DataframeType(BaseType):
         comparison_data: Union[int, pd.Series] = self.get_comparator_data(comparator, value_is_literal)
         if isinstance(comparison_data, pd.Series):
             if is_integer_dtype(comparison_data):
-                results = self.value[target].str.len().ge(comparison_data)
+                results = self._string_lengths(target).ge(comparison_data)
             else:
-                results = self.value[target].str.len().ge(comparison_data.str.len())
+                comparison_lengths = (
+                    comparison_data.str.len() if value_is_literal else self._string_lengths(comparator)
+                )
+                results = self._string_lengths(target).ge(comparison_lengths)
         else:
-            results = self.value[target].str.len().ge(comparator)
-        return pd.Series(results.values)
+            results = self._string_lengths(target).ge(comparator)
+        return results
 
     @type_operator(FIELD_DATAFRAME)
     def shorter_than(self, other_value: dict):
@@ -769,20 +1106,17 @@ class DataframeType(BaseType):
     @type_operator(FIELD_DATAFRAME)
     def empty(self, other_value: dict):
         target = self.replace_prefix(other_value.get("target"))
-        results = np.where(self.value[target].isin(["", None]), True, False)
-        return pd.Series(results)
+        results = self._is_null_data(self.value[target])
+        return pd.Series(results, index=self.value.index)
 
     @type_operator(FIELD_DATAFRAME)
     def empty_within_except_last_row(self, other_value: dict):
         target = self.replace_prefix(other_value.get("target"))
         comparator = other_value.get("comparator")
-        # group all targets by comparator
-        grouped_target = self.value.groupby(comparator)[target]
-        # validate all targets except the last one
-        results = grouped_target.apply(lambda x: x[:-1]).apply(lambda x: x in ["", None])
-        # extract values with corresponding indexes from results
-        self.value[f"result_{uuid4()}"] = results.reset_index(level=0, drop=True)
-        return True in results.values
+        # validate all targets except the last row of each group
+        not_last_row = self.value.groupby(comparator).cumcount(ascending=False) > 0
+        results = not_last_row.to_numpy() & self._is_null_data(self.value[target])
+        return bool(results.any())
 
     @type_operator(FIELD_DATAFRAME)
     def non_empty(self, other_value: dict):
@@ -792,13 +1126,10 @@ class DataframeType(BaseType):
     def non_empty_within_except_last_row(self, other_value: dict):
         target = self.replace_prefix(other_value.get("target"))
         comparator = other_value.get("comparator")
-        # group all targets by comparator
-        grouped_target = self.value.groupby(comparator)[target]
-        # validate all targets except the last one
-        results = ~grouped_target.apply(lambda x: x[:-1]).apply(lambda x: x in ["", None])
-        # extract values with corresponding indexes from results
-        self.value[f"result_{uuid4()}"] = results.reset_index(level=0, drop=True)
-        return not(False in results.values)
+        # validate all targets except the last row of each group
+        not_last_row = self.value.groupby(comparator).cumcount(ascending=False) > 0
+        results = not_last_row.to_numpy() & self._is_null_data(self.value[target])
+        return not results.any()
 
     @type_operator(FIELD_DATAFRAME)
     def contains_all(self, other_value: dict):
@@ -806,11 +1137,29 @@ class DataframeType(BaseType):
         comparator = other_value.get("comparator")
         if isinstance(comparator, list):
             # get column as array of values
-            values = flatten_list(self.value, comparator)
+            values = list(flatten_list(self.value, comparator))
         else:
             comparator = self.replace_prefix(comparator)
-            values = self.value[comparator].unique()
-        return set(values).issubset(set(self.value[target].unique()))
+            values = self._unique_values(comparator)
+        try:
+            # probe the target's distinct values so the first missing
+            # comparator value short-circuits the whole check
+            target_set = set(self._unique_values(target))
+            return all(value in target_set for value in values)
+        except TypeError:
+            # unhashable values (e.g. lists) fall back to the index scan
+            return bool(pd.Index(values).isin(self._unique_values(target)).all())
+
+    def _unique_values(self, column_name: str):
+        """
+        Distinct values of a column, memoized per column so repeated
+        rules against the same dataframe skip the dedup pass. unique()
+        is used for categoricals too: their declared categories may
+        include values that never occur in the data.
+        """
+        if column_name not in self._unique_cache:
+            self._unique_cache[column_name] = self.value[column_name].unique()
+        return self._unique_cache[column_name]
     
     @type_operator(FIELD_DATAFRAME)
     def not_contains_all(self, other_value: dict):
@@ -819,16 +1168,60 @@ class DataframeType(BaseType):
     @type_operator(FIELD_DATAFRAME)
     def invalid_date(self, other_value):
         target = self.replace_prefix(other_value.get("target"))
-        results = ~vectorized_is_valid(self.value[target])
-        return pd.Series(results)
+        if target not in self._valid_date_cache:
+            self._valid_date_cache[target] = vectorized_is_valid(self.value[target])
+        return pd.Series(~self._valid_date_cache[target])
     
+    def _parsed_dates(self, data: Union[str, pd.Series]):
+        """
+        Parses date strings with utils.get_date, caching whole columns by
+        name so repeated date operators against the same column parse it
+        only once. Empty values are kept as None.
+        """
+        if isinstance(data, pd.Series):
+            if data.name not in self._parsed_date_cache:
+                self._parsed_date_cache[data.name] = np.array(
+                    [get_date(value) if value else None for value in data], dtype=object
+                )
+            return self._parsed_date_cache[data.name]
+        return get_date(data) if data else None
+
+    def _date_components(self, data: Union[str, pd.Series], component):
+        """
+        Extracts the requested date component for a whole column (or a
+        scalar comparator), memoized per (column, component) pair so each
+        side of a date comparison is computed once across operators.
+        Unparseable/empty values stay None.
+        """
+        if isinstance(data, pd.Series):
+            key = (data.name, component)
+            if key not in self._date_component_cache:
+                self._date_component_cache[key] = np.array(
+                    [
+                        None if date is None else get_date_component_value(component, date)
+                        for date in self._parsed_dates(data)
+                    ],
+                    dtype=object,
+                )
+            return self._date_component_cache[key]
+        date = self._parsed_dates(data)
+        return None if date is None else get_date_component_value(component, date)
+
     def date_comparison(self, other_value, operator):
         target = self.replace_prefix(other_value.get("target"))
         comparator = self.replace_prefix(other_value.get("comparator"))
         value_is_literal: bool = other_value.get("value_is_literal", False)
         comparison_data: Union[str, pd.Series] = self.get_comparator_data(comparator, value_is_literal)
         component = other_value.get("date_component")
-        results = np.where(vectorized_compare_dates(component, self.value[target], comparison_data, operator), True, False)
+        target_components = self._date_components(self.value[target], component)
+        comparison_components = self._date_components(comparison_data, component)
+        if not isinstance(comparison_components, np.ndarray):
+            comparison_components = np.full(len(target_components), comparison_components, dtype=object)
+        # comparison returns False wherever either side is missing
+        valid = (target_components != None) & (comparison_components != None)  # noqa: E711
+        results = np.zeros(len(target_components), dtype=bool)
+        if valid.any():
+            results[valid] = operator(target_components[valid], comparison_components[valid])
         return pd.Series(results)
     
     @type_operator(FIELD_DATAFRAME)
@@ -862,8 +1255,9 @@ class DataframeType(BaseType):
     @type_operator(FIELD_DATAFRAME)
     def is_complete_date(self, other_value):
         target = self.replace_prefix(other_value.get("target"))
-        results = vectorized_is_complete_date(self.value[target])
-        return pd.Series(results)
+        if target not in self._complete_date_cache:
+            self._complete_date_cache[target] = vectorized_is_complete_date(self.value[target])
+        return pd.Series(self._complete_date_cache[target])
 
     @type_operator(FIELD_DATAFRAME)
     def is_unique_set(self, other_value):
@@ -877,9 +1271,8 @@ class DataframeType(BaseType):
             if target_name in self.value.columns:
                 target_names.append(target_name)
         target_names = list(set(target_names))
-        counts = self.value[target_names].groupby(target_names)[target].transform('size') 
-        results = np.where(counts <= 1, True, False)
-        return pd.Series(results)
+        counts = self.value[target_names].groupby(target_names)[target].transform('size')
+        return pd.Series((counts <= 1).to_numpy())
 
     @type_operator(FIELD_DATAFRAME)
     def is_not_unique_relationship(self, other_value) -> pd.Series:
@@ -908,19 +1301,17 @@ class DataframeType(BaseType):
             comparator = self.replace_all_prefixes(comparator)
         else:
             comparator = self.replace_prefix(comparator)
-        # remove repeating rows
-        df_without_duplicates: pd.DataFrame = self.value[[target, comparator]].drop_duplicates()
-        # we need to check if ANY of the columns (target or comparator) is duplicated
-        duplicated_comparator: pd.Series = df_without_duplicates[comparator].duplicated(keep=False)
-        duplicated_target: pd.Series = df_without_duplicates[target].duplicated(keep=False)
-        result = pd.Series([False] * len(self.value))
-        if duplicated_comparator.any():
-            duplicated_comparator_values = set(df_without_duplicates[duplicated_comparator][comparator])
-            result += self.value[comparator].isin(duplicated_comparator_values)
-        if duplicated_target.any():
-            duplicated_target_values = set(df_without_duplicates[duplicated_target][target])
-            result += self.value[target].isin(duplicated_target_values)
-        return result
+        # the relationship is one-to-one iff each side maps to exactly one
+        # distinct value on the other side
+        target_counts = self.value.groupby(target, dropna=False)[comparator].nunique(dropna=False)
+        comparator_counts = self.value.groupby(comparator, dropna=False)[target].nunique(dropna=False)
+        # .map over a categorical column can hand the counts back as a
+        # categorical, which refuses ordered comparison; map the object
+        # view so the counts stay plain ints
+        mapped_target_counts = self.value[target].astype(object).map(target_counts)
+        mapped_comparator_counts = self.value[comparator].astype(object).map(comparator_counts)
+        results = (mapped_target_counts > 1) | (mapped_comparator_counts > 1)
+        return results.reset_index(drop=True)
 
     @type_operator(FIELD_DATAFRAME)
     def is_unique_relationship(self, other_value) -> pd.Series:
@@ -930,33 +1321,44 @@ class DataframeType(BaseType):
     def is_not_unique_set(self, other_value):
         return ~self.is_unique_set(other_value)
         
+    def _is_ordered_within(self, target, group_column):
+        if not isinstance(group_column, str):
+            raise Exception('Comparator must be a single String value')
+        # rules commonly probe both the positive and the negated operator,
+        # so the verdict is memoized per (target, group) pair
+        key = (target, group_column)
+        if key not in self._ordered_cache:
+            self._ordered_cache[key] = bool(self.value.groupby(group_column)[target].is_monotonic_increasing.all())
+        return self._ordered_cache[key]
+
     @type_operator(FIELD_DATAFRAME)
     def is_ordered_set(self, other_value):
         target = self.replace_prefix(other_value.get("target"))
-        value = other_value.get("comparator")
-        if not isinstance(value, str):
-            raise Exception('Comparator must be a single String value')
-            
-        return not (False in self.value.groupby(value).agg(lambda x : list(x))[target].map(lambda x: sorted(x) == x).tolist())
-       
+        return self._is_ordered_within(target, other_value.get("comparator"))
+
     @type_operator(FIELD_DATAFRAME)
     def is_not_ordered_set(self, other_value):
         target = self.replace_prefix(other_value.get("target"))
-        value = other_value.get("comparator")
-        if not isinstance(value, str):
-            raise Exception('Comparator must be a single String value')
-            
-        return False in self.value.groupby(value).agg(lambda x : list(x))[target].map(lambda x: sorted(x) == x).tolist() 
+        return not self._is_ordered_within(target, other_value.get("comparator"))
 
     @type_operator(FIELD_DATAFRAME)
     def is_valid_reference(self, other_value):
         target = self.replace_prefix(other_value.get("target"))
         context = self.replace_prefix(other_value.get("context"))
         if context:
-            results = self.value.apply(lambda row: row[target] in self.relationship_data.get(row[context], {}), axis=1)
+            valid_pairs = [
+                (context_value, key)
+                for context_value, keys in self.relationship_data.items()
+                for key in keys
+            ]
+            if valid_pairs:
+                row_pairs = pd.MultiIndex.from_arrays([self.value[context], self.value[target]])
+                results = pd.Series(row_pairs.isin(pd.MultiIndex.from_tuples(valid_pairs)), index=self.value.index)
+            else:
+                results = pd.Series(False, index=self.value.index)
         else:
             results = self.value[target].isin(self.relationship_data)
-        return pd.Series(results.values)
+        return results
 
     @type_operator(FIELD_DATAFRAME)
     def is_not_valid_reference(self, other_value):
@@ -967,40 +1369,78 @@ class DataframeType(BaseType):
         target = self.replace_prefix(other_value.get("target"))
         value_column = self.replace_prefix(other_value.get("comparator"))
         context = self.replace_prefix(other_value.get("context"))
-        results = self.value.apply(lambda row: self.detect_reference(row, value_column, target, context), axis=1)
-        return pd.Series(results.values)
+        results = pd.Series(False, index=self.value.index)
+        # Rows sharing a (context, target) pair probe the same reference array,
+        # so membership is resolved once per group instead of once per row.
+        grouped = self.value.groupby([context, target] if context else target, sort=False)[value_column]
+        for key, values in grouped:
+            if context:
+                context_value, target_key = key
+                target_data = self.relationship_data.get(context_value, {}).get(target_key, pd.Series([]).values)
+            else:
+                target_data = self.relationship_data.get(key, pd.Series([]).values)
+            hits = values.isin(target_data)
+            if not hits.all():
+                misses = values[~hits]
+                hits.loc[misses.index] = (
+                    misses.isin(target_data.astype(int).astype(str)) | misses.isin(target_data.astype(str))
+                )
+            results.loc[hits.index] = hits.values
+        return results
 
     @type_operator(FIELD_DATAFRAME)
     def is_not_valid_relationship(self, other_value):
         return ~self.is_valid_relationship(other_value)
 
+    def _evaluate_vlm_predicate(self, predicate, mask=None):
+        """
+        Evaluates a value level metadata predicate over the dataframe.
+        Predicates that understand dataframes (returning a boolean Series
+        aligned with the rows they were given) run in a single vectorized
+        pass; row level predicates fall back to a per-row apply. A mask
+        restricts evaluation to the matching rows, mirroring the
+        short-circuit of `filter(row) and check(row)`.
+        """
+        frame = self.value if mask is None else self.value[mask]
+        if frame.empty:
+            return pd.Series(False, index=self.value.index)
+        try:
+            result = predicate(frame)
+        except Exception:
+            result = None
+        if isinstance(result, pd.Series) and len(result) == len(frame):
+            result = result.astype(bool)
+        else:
+            result = frame.apply(predicate, axis=1).astype(bool)
+        if mask is not None:
+            result = result.reindex(self.value.index, fill_value=False)
+        return result
+
+    def _check_vlm_conformance(self, check_key, conformant):
+        results = pd.Series(False, index=self.value.index)
+        for vlm in self.value_level_metadata:
+            matches = self._evaluate_vlm_predicate(vlm["filter"])
+            if not matches.any():
+                continue
+            checks = self._evaluate_vlm_predicate(vlm[check_key], mask=matches)
+            results |= matches & (checks if conformant else ~checks)
+        return results
+
     @type_operator(FIELD_DATAFRAME)
     def non_conformant_value_data_type(self, other_value):
-        results = False
-        for vlm in self.value_level_metadata:
-            results |= self.value.apply(lambda row: vlm["filter"](row) and not vlm["type_check"](row), axis=1)
-        return pd.Series(results.values)
+        return self._check_vlm_conformance("type_check", conformant=False)
 
     @type_operator(FIELD_DATAFRAME)
     def non_conformant_value_length(self, other_value):
-        results = False
-        for vlm in self.value_level_metadata:
-            results |= self.value.apply(lambda row: vlm["filter"](row) and not vlm["length_check"](row), axis=1)
-        return pd.Series(results.values)
-    
+        return self._check_vlm_conformance("length_check", conformant=False)
+
     @type_operator(FIELD_DATAFRAME)
     def conformant_value_data_type(self, other_value):
-        results = False
-        for vlm in self.value_level_metadata:
-            results |= self.value.apply(lambda row: vlm["filter"](row) and vlm["type_check"](row), axis=1)
-        return pd.Series(results.values)
+        return self._check_vlm_conformance("type_check", conformant=True)
 
     @type_operator(FIELD_DATAFRAME)
     def conformant_value_length(self, other_value):
-        results = False
-        for vlm in self.value_level_metadata:
-            results |= self.value.apply(lambda row: vlm["filter"](row) and vlm["length_check"](row), axis=1)
-        return pd.Series(results.values)
+        return self._check_vlm_conformance("length_check", conformant=True)
 
     @type_operator(FIELD_DATAFRAME)
     def has_next_corresponding_record(self, other_value: dict):
@@ -1015,26 +1455,23 @@ class DataframeType(BaseType):
         comparator = self.replace_prefix(other_value.get("comparator"))
         group_by_column: str = self.replace_prefix(other_value.get("within"))
         order_by_column: str = self.replace_prefix(other_value.get("ordering"))
-        ordered_df = self.value.sort_values(by=[order_by_column])
+        ordered_df = self.value.sort_values(by=[group_by_column, order_by_column])
         grouped_df = ordered_df.groupby(group_by_column)
-        results = grouped_df.apply(lambda x: self.compare_target_with_comparator_next_row(x, target, comparator))
-        return pd.Series(results.explode().tolist())
+        # compare object views: categorical columns with different
+        # category sets refuse .eq against each other
+        equal = ordered_df[target].astype(object).eq(
+            grouped_df[comparator].shift(-1).astype(object)
+        ).to_numpy()
+        # numpy booleans survive a later ~ negation, python booleans would not
+        results = pd.Series(list(equal), dtype=object)
+        # the last row of a group has no next row to compare with
+        results[(grouped_df.cumcount(ascending=False) == 0).to_numpy()] = pandas.NA
+        return results
 
     @type_operator(FIELD_DATAFRAME)
     def does_not_have_next_corresponding_record(self, other_value: dict):
         return ~self.has_next_corresponding_record(other_value)
 
-    def compare_target_with_comparator_next_row(self, df: pd.DataFrame, target: str, comparator: str):
-        """
-        Compares current row of a target with the next row of comparator.
-        We can't compare last row of target with the next row of comparator
-        because there is no row after the last one.
-        """
-        target_without_last_row = df[target].drop(df[target].tail(1).index)
-        comparator_without_first_row = df[comparator].drop(df[comparator].head(1).index)
-        results = np.where(target_without_last_row.values == comparator_without_first_row.values, True, False)
-        return [*results, pandas.NA]  # appending NA here to make the length of results list the same as length of df
-
     @type_operator(FIELD_DATAFRAME)
     def present_on_multiple_rows_within(self, other_value: dict):
         """
@@ -1045,15 +1482,8 @@ class DataframeType(BaseType):
         target = self.replace_prefix(other_value.get("target"))
         min_count: int = other_value.get("comparator") or 1
         group_by_column = self.replace_prefix(other_value.get("within"))
-        grouped = self.value.groupby(group_by_column)
-        results = grouped.apply(lambda x: self.validate_series_length(x[target], min_count))
-        return pd.Series(results.explode().tolist())
-
-    def validate_series_length(self, ser: pd.Series, min_length: int):
-        if len(ser) > min_length:
-            return [True] * len(ser)
-        else:
-            return [False] * min_length
+        counts = self.value.groupby(group_by_column)[target].transform("size")
+        return pd.Series(counts.to_numpy() > min_count)
 
     @type_operator(FIELD_DATAFRAME)
     def not_present_on_multiple_rows_within(self, other_value: dict):
@@ -1067,6 +1497,18 @@ class DataframeType(BaseType):
         value = row[value_column]
         return (value in target_data) or (value in target_data.astype(int).astype(str)) or (value in target_data.astype(str))
 
+    def _additional_columns(self, target: str) -> pd.DataFrame:
+        """
+        Columns named like the target followed by an integer suffix
+        (TSVAL -> TSVAL1, TSVAL2, ...), resolved once per target.
+        """
+        if target not in self._additional_column_cache:
+            pattern = _compile_regex(rf"^{target}\d+$")
+            self._additional_column_cache[target] = [
+                column for column in self.value.columns if pattern.match(column)
+            ]
+        return self.value[self._additional_column_cache[target]]
+
     @type_operator(FIELD_DATAFRAME)
     def additional_columns_empty(self, other_value: dict):
         """
@@ -1082,11 +1524,14 @@ class DataframeType(BaseType):
         and ensures they are not empty.
         """
         target: str = self.replace_prefix(other_value.get("target"))
-        regex: str = rf"^{target}\d+$"  # starting from target, ending with integers and nothing is between them
-        df: pd.DataFrame = self.value.filter(regex=regex)
-        # applying a function to each row
-        result: pd.Series = df.apply(lambda row: self.next_column_exists_and_previous_is_null(row), axis=1)
-        return result
+        df: pd.DataFrame = self._additional_columns(target)
+        null_mask: np.ndarray = df.isin([[], {}, "", None]).to_numpy()
+        results: np.ndarray = np.zeros(len(df), dtype=bool)
+        for position in range(df.shape[1] - 1):
+            # elementwise comparison with None mirrors the original per-row check
+            next_column_is_not_none = df.iloc[:, position + 1].to_numpy() != None
+            results |= null_mask[:, position] & next_column_is_not_none
+        return pd.Series(results, index=df.index)
 
     @type_operator(FIELD_DATAFRAME)
     def additional_columns_not_empty(self, other_value: dict):
@@ -1096,9 +1541,14 @@ class DataframeType(BaseType):
     def references_correct_codelist(self, other_value: dict):
         target: str = self.replace_prefix(other_value.get("target"))
         comparator = self.replace_prefix(other_value.get("comparator"))
-        result: pd.Series = self.value.apply(lambda row: self.valid_codelist_reference(row[target], row[comparator]), axis=1)
-        return result
-    
+        results = pd.Series(True, index=self.value.index)
+        # the codelist map is resolved once per referenced column, not per row
+        for column_name, codelists in self.value.groupby(target, sort=False, dropna=False)[comparator]:
+            allowed = self._resolve_column_codelists(column_name)
+            if allowed is not None:
+                results.loc[codelists.index] = codelists.isin(allowed).to_numpy()
+        return results
+
     @type_operator(FIELD_DATAFRAME)
     def does_not_reference_correct_codelist(self, other_value: dict):
         return ~self.references_correct_codelist(other_value)
@@ -1107,33 +1557,44 @@ class DataframeType(BaseType):
     def uses_valid_codelist_terms(self, other_value: dict):
         target: str = self.replace_prefix(other_value.get("target"))
         comparator = self.replace_prefix(other_value.get("comparator"))
-        result: pd.Series = self.value.apply(lambda row: self.valid_terms(row[target], row[comparator]), axis=1)
-        return result
+        results = pd.Series(True, index=self.value.index)
+        # term maps are materialized once per distinct codelist
+        for codelist, terms in self.value.groupby(target, sort=False, dropna=False)[comparator]:
+            if not codelist:
+                continue
+            entries = [term_map[codelist] for term_map in self.codelist_term_maps if codelist in term_map]
+            if any(entry.get("extensible") for entry in entries):
+                continue
+            allowed_sets = [set(entry.get("allowed_terms", [])) for entry in entries]
+            results.loc[terms.index] = terms.map(
+                lambda terms_list: any(set(terms_list).issubset(allowed) for allowed in allowed_sets)
+            ).to_numpy()
+        return results
 
     @type_operator(FIELD_DATAFRAME)
     def does_not_use_valid_codelist_terms(self, other_value: dict):
         return ~self.uses_valid_codelist_terms(other_value)
 
-    def next_column_exists_and_previous_is_null(self, row: pd.Series) -> bool:
-        row.reset_index(drop=True, inplace=True)
-        for index in row[row.isin([[], {}, "", None])].index:  # leaving null values only
-            next_position: int = index + 1
-            if next_position < len(row) and row[next_position] is not None:
-                return True
-        return False
-    
-    def valid_codelist_reference(self, column_name, codelist):
+    def _resolve_column_codelists(self, column_name):
+        """
+        Returns the codelists mapped to a column, or None when the column
+        (including its generic version, i.e --DECOD) is not mapped.
+        """
         if column_name in self.column_codelist_map:
-            return codelist in self.column_codelist_map[column_name]
+            return self.column_codelist_map[column_name]
         elif self.column_prefix_map:
             # Check for generic versions of variables (i.e --DECOD)
             for key in self.column_prefix_map:
                 if column_name.startswith(self.column_prefix_map[key]):
                     generic_column_name = column_name.replace(self.column_prefix_map[key], key, 1)
                     if generic_column_name in self.column_codelist_map:
-                        return codelist in self.column_codelist_map.get(generic_column_name)
-        return True
-    
+                        return self.column_codelist_map.get(generic_column_name)
+        return None
+
+    def valid_codelist_reference(self, column_name, codelist):
+        allowed = self._resolve_column_codelists(column_name)
+        return True if allowed is None else codelist in allowed
+
     def valid_terms(self, codelist, terms_list):
         if not codelist:
             return True
@@ -1150,7 +1611,7 @@ class DataframeType(BaseType):
         """
         target: str = self.replace_prefix(other_value.get("target"))
         is_valid: bool = len(self.value[target].unique()) > 1
-        return pandas.Series([is_valid] * len(self.value[target]))
+        return pandas.Series(np.full(len(self.value), is_valid, dtype=bool))
 
     @type_operator(FIELD_DATAFRAME)
     def has_same_values(self, other_value: dict):
@@ -1180,7 +1641,7 @@ class DataframeType(BaseType):
         """
         target: str = self.replace_prefix(other_value.get("target"))
         reference_count_column: str = self.replace_prefix(other_value.get("comparator"))
-        result = np.where(vectorized_get_dict_key(self.value[reference_count_column], self.value[target]) > 1, True, False)
+        result = vectorized_get_dict_key(self.value[reference_count_column], self.value[target]) > 1
         return pd.Series(result)
 
     @type_operator(FIELD_DATAFRAME)
@@ -1195,20 +1656,20 @@ class DataframeType(BaseType):
         target: str = self.replace_prefix(other_value.get("target"))
         within: str = self.replace_prefix(other_value.get("within"))
         columns = other_value["comparator"]
-        for col in columns:
-            comparator: str = self.replace_prefix(col["name"])
-            ascending: str = col["sort_order"] != "DESC"
-            na_pos: str = col["null_position"]
-
-            grouped_df: pd.Series = self.value.sort_values(
-                by=[within, comparator],
-                na_position=na_pos
-            ).groupby([within]).apply(lambda x: x)
-            temp_target: pd.Series = grouped_df.groupby(within).cumcount().apply(lambda x: x+1)
-            if not ascending:
-                grouped_df = grouped_df.reset_index(drop=True)
-                temp_target = temp_target[::-1].reset_index(drop=True)
-        return temp_target.eq(grouped_df[target]).sort_index(axis=0)
+        # the original loop discarded every iteration but the last, so only
+        # the last comparator ever influenced the result; keeping that
+        # behavior without re-sorting once per column
+        col = columns[-1]
+        comparator: str = self.replace_prefix(col["name"])
+        ascending: bool = col["sort_order"] != "DESC"
+        na_pos: str = col["null_position"]
+
+        sorted_df: pd.DataFrame = self.value.sort_values(by=[within, comparator], na_position=na_pos)
+        temp_target: pd.Series = sorted_df.groupby(within).cumcount() + 1
+        if not ascending:
+            sorted_df = sorted_df.reset_index(drop=True)
+            temp_target = temp_target[::-1].reset_index(drop=True)
+        return temp_target.eq(sorted_df[target]).sort_index(axis=0)
 
     @type_operator(FIELD_DATAFRAME)
     def target_is_not_sorted_by(self, other_value: dict) -> pd.Series:
@@ -1228,7 +1689,7 @@ class DataframeType(BaseType):
         target = self.replace_prefix(other_value.get("target"))
         comparator = other_value.get("comparator") # Assumes the comparator is a value not a column
         metadata_column = self.replace_prefix(other_value.get("metadata"))
-        result = np.where(vectorized_get_dict_key(self.value[metadata_column], target) == comparator, True, False)
+        result = vectorized_get_dict_key(self.value[metadata_column], target) == comparator
         return pd.Series(result)
     
     @type_operator(FIELD_DATAFRAME)
@@ -1244,27 +1705,30 @@ class GenericType(SelectMultipleType, SelectType, StringType, NumericType, Boole
     EPSILON = Decimal('0.000001')
     name = "generic"
 
-    def _assert_valid_value_and_cast(self, value):        
+    def __init__(self, value):
+        super().__init__(value)
+        # the numeric/string decision is made once here so the equal_to
+        # dispatchers below don't re-run the isinstance chain per call;
+        # _assert_valid_value_and_cast must stay side-effect free because
+        # it is also the per-argument cast hook for every operator
+        self._is_numeric = isinstance(self.value, (Decimal, float) + integer_types)
+
+    def _assert_valid_value_and_cast(self, value):
         if isinstance(value, string_types):
             # String type
             return str(value)
-        
-        elif isinstance(value, float):
-            # In python 2.6, casting float to Decimal doesn't work
-            return float_to_decimal(value)
-        elif isinstance(value, integer_types):
-            return Decimal(value)
-        else:
-            return value
+        # numerics are kept native, mirroring NumericType; Decimal
+        # arithmetic only happens when the caller passed a Decimal
+        return value
 
     def equal_to(self, other):
-        if isinstance(self.value, Decimal):
+        if self._is_numeric:
             return self.num_equal_to(other)
         else:
             return self.str_equal_to(other)
-    
+
     def not_equal_to(self, other):
-        if isinstance(self.value, Decimal):
+        if self._is_numeric:
             return self.num_not_equal_to(other)
         else:
             return self.str_not_equal_to(other)
@@ -1276,15 +1740,17 @@ class GenericType(SelectMultipleType, SelectType, StringType, NumericType, Boole
 
     @type_operator(FIELD_NUMERIC)
     def num_equal_to(self, other_numeric):
-        return abs(self.value - other_numeric) <= self.EPSILON
-    
+        difference, epsilon = self._difference_and_epsilon(other_numeric)
+        return abs(difference) <= epsilon
+
     @type_operator(FIELD_TEXT)
     def str_equal_to(self, other_string):
         return self.value == other_string
 
     @type_operator(FIELD_NUMERIC)
     def num_not_equal_to(self, other_numeric):
-        return abs(self.value - other_numeric) > self.EPSILON
+        difference, epsilon = self._difference_and_epsilon(other_numeric)
+        return abs(difference) > epsilon
 
     @type_operator(FIELD_TEXT)
     def str_not_equal_to(self, other_string):
@@ -1,8 +1,10 @@
 from decimal import Decimal, Inexact, Context
 from datetime import datetime, tzinfo
+from functools import lru_cache
 import re
 import inspect
 import numpy as np
+import pandas as pd
 from dateutil.parser import parse, isoparse
 import pytz
 
@@ -88,6 +90,15 @@ def get_microsecond(date_string: str):
     timestamp = get_date(date_string)
     return timestamp.microsecond
 
+def get_date_component_value(component: str, date):
+    """
+    Extracts a component from an already parsed datetime,
+    falling back to the datetime itself for unknown components.
+    """
+    if component in ("year", "month", "day", "hour", "minute", "second", "microsecond"):
+        return getattr(date, component)
+    return date
+
 def get_date_component(component: str, date_string: str):
     component_func_map = {
         "year": get_year,
@@ -143,8 +154,12 @@ def compare_dates(component, target, comparator, operator):
     else:
         return operator(get_date_component(component, target), get_date_component(component, comparator))
 
+@lru_cache(maxsize=256)
+def _compile_regex(regex: str):
+    return re.compile(regex)
+
 def apply_regex(regex: str, val: str):
-    result = re.findall(regex, val)
+    result = _compile_regex(regex).findall(val)
     if result:
         return result[0]
     else:
@@ -159,10 +174,24 @@ def flatten_list(data, l):
        else:
            yield item
 
+def _map_unique(func, values):
+    """
+    Applies a scalar predicate once per distinct value and broadcasts the
+    answers back, so columns with repeating values (the norm for date
+    columns) only pay for each distinct parse.
+    """
+    series = pd.Series(values)
+    mapping = {value: func(value) for value in series.unique()}
+    return series.map(mapping).to_numpy()
+
+def vectorized_is_complete_date(values):
+    return _map_unique(is_complete_date, values)
+
+def vectorized_is_valid(values):
+    return _map_unique(is_valid_date, values)
+
 vectorized_apply_regex = np.vectorize(apply_regex)
-vectorized_is_complete_date = np.vectorize(is_complete_date)
 vectorized_compare_dates = np.vectorize(compare_dates)
-vectorized_is_valid = np.vectorize(is_valid_date)
 vectorized_get_dict_key = np.vectorize(get_dict_key_val)
 vectorized_is_in = np.vectorize(is_in)
 vectorized_case_insensitive_is_in = np.vectorize(case_insensitive_is_in)
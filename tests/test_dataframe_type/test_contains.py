@@ -192,6 +192,22 @@ class ContainsTests(TestCase):
             "comparator": ["required_variables"]
         }))
 
+    def test_contains_all_categorical_with_unused_categories(self):
+        # a declared-but-never-present category must not count as present
+        df = pandas.DataFrame.from_dict(
+            {
+                "var1": pandas.Categorical(["X", "Y", "X"], categories=["X", "Y", "Z"]),
+            }
+        )
+        self.assertFalse(DataframeType({"value": df}).contains_all({
+            "target": "var1",
+            "comparator": ["Z"],
+        }))
+        self.assertTrue(DataframeType({"value": df}).contains_all({
+            "target": "var1",
+            "comparator": ["X", "Y"],
+        }))
+
     def test_not_contains_all(self):
         df = pandas.DataFrame.from_dict(
             {
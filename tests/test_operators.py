@@ -74,10 +74,12 @@ class NumericOperatorTests(TestCase):
         ten_var_int = NumericType(ten_int)
         ten_var_float = NumericType(ten_float)
         ten_var_long = NumericType(ten_long)
+        # Decimal inputs stay Decimal, native ints and floats are kept
+        # native so operators can use cheap float arithmetic
         self.assertTrue(isinstance(ten_var_dec.value, Decimal))
-        self.assertTrue(isinstance(ten_var_int.value, Decimal))
-        self.assertTrue(isinstance(ten_var_float.value, Decimal))
-        self.assertTrue(isinstance(ten_var_long.value, Decimal))
+        self.assertTrue(isinstance(ten_var_int.value, int))
+        self.assertTrue(isinstance(ten_var_float.value, float))
+        self.assertTrue(isinstance(ten_var_long.value, int))
 
     def test_numeric_equal_to(self):
         self.assertTrue(NumericType(10).equal_to(10))
@@ -209,6 +211,20 @@ class SelectMultipleOperatorTests(TestCase):
                          shares_no_elements_with([4, "A"]))
 
 class DataframeOperatorTests(TestCase):
+    def test_categorization_does_not_mutate_input(self):
+        """
+        Low-cardinality string columns are converted to the category
+        dtype for internal use, but the caller's dataframe must keep
+        its dtypes.
+        """
+        df = pandas.DataFrame.from_dict({
+            "var1": ["X", "Y", "X", "Y", "X", "X", ],
+            "var2": [1, 2, 3, 4, 5, 6, ],
+        })
+        df_type = DataframeType({"value": df})
+        self.assertEqual(df["var1"].dtype, object)
+        self.assertIsInstance(df_type.value["var1"].dtype, pd.CategoricalDtype)
+
     def test_exists(self):
         df = pandas.DataFrame.from_dict({
             "var1": [1, 2, 4, ],
@@ -623,6 +639,15 @@ class DataframeOperatorTests(TestCase):
             "target": "var1",
             "comparator": "var4",
         }).equals(pandas.Series([True, False])))
+        # missing values on either side compare False instead of erroring
+        df_with_missing = pandas.DataFrame.from_dict({
+            "var1": ["WORD", "test", None],
+            "var2": ["WO", None, "te"],
+        })
+        self.assertTrue(DataframeType({"value": df_with_missing}).starts_with({
+            "target": "var1",
+            "comparator": "var2",
+        }).equals(pandas.Series([True, False, False])))
 
     def test_ends_with(self):
         df = pandas.DataFrame.from_dict({
@@ -645,6 +670,15 @@ class DataframeOperatorTests(TestCase):
             "target": "var1",
             "comparator": "var4",
         }).equals(pandas.Series([True, False])))
+        # missing values on either side compare False instead of erroring
+        df_with_missing = pandas.DataFrame.from_dict({
+            "var1": ["WORD", "test", None],
+            "var2": ["RD", None, "st"],
+        })
+        self.assertTrue(DataframeType({"value": df_with_missing}).ends_with({
+            "target": "var1",
+            "comparator": "var2",
+        }).equals(pandas.Series([True, False, False])))
  
     def test_date_equal_to(self):
         df = pandas.DataFrame.from_dict(
@@ -986,6 +1020,18 @@ class DataframeOperatorTests(TestCase):
             {"target": "--SITDESC", "comparator": "--SIT"}).equals(pandas.Series([True, True, True, True, False]))
         )
 
+        # low-cardinality string columns are converted to the category
+        # dtype on ingest and must still compare
+        df_low_cardinality = pandas.DataFrame.from_dict(
+            {
+                "VISITNUM": ["X", "Y", "X", "Y", "X", "X"],
+                "VISIT": ["Y", "X", "Y", "X", "X", "X"],
+            }
+        )
+        self.assertTrue(DataframeType({"value": df_low_cardinality}).is_not_unique_relationship(
+            {"target": "VISITNUM", "comparator": "VISIT"}).equals(pandas.Series([True, True, True, True, True, True]))
+        )
+
     def test_empty_within_except_last_row(self):
         df = pandas.DataFrame.from_dict(
             {
@@ -1252,6 +1298,20 @@ class DataframeOperatorTests(TestCase):
         result = DataframeType({"value": invalid_df}).has_next_corresponding_record(other_value)
         self.assertTrue(result.equals(pandas.Series([False, False, False, pandas.NA, True, True, True, pandas.NA])))
 
+        # low-cardinality string columns become categoricals on ingest
+        # with different category sets and must still compare
+        categorical_df = pandas.DataFrame.from_dict(
+            {
+                "USUBJID": [789, 789, 789, 790, 790, 790, ],
+                "SESEQ": [1, 2, 3, 4, 5, 6, ],
+                "SEENDTC": ["A", "B", "A", "B", "A", "A"],
+                "SESTDTC": ["B", "C", "B", "C", "B", "B"],
+            }
+        )
+        other_value: dict = {"target": "SEENDTC", "comparator": "SESTDTC", "within": "USUBJID", "ordering": "SESEQ"}
+        result = DataframeType({"value": categorical_df}).has_next_corresponding_record(other_value)
+        self.assertTrue(result.equals(pandas.Series([False, True, pandas.NA, True, False, pandas.NA])))
+
     def test_does_not_have_next_corresponding_record(self):
         """
         Test for does_not_have_next_corresponding_record operator.